@@ -29,7 +29,7 @@ Merges dynamic calculations with full documentation including:
 - Operation and troubleshooting guides
 
 Usage:
-    python3 ForgeDesigner.py [--debug] [--json]
+    python3 ForgeDesigner.py [--debug] [--json] [--no-pdf] [--batch FILE [--jobs N]]
 
 Requires: reportlab (pip install reportlab)
 
@@ -38,18 +38,51 @@ Author: Gary (with AI assistance)
 
 import sys
 import argparse
+import functools
 import json
+import math
+from collections import namedtuple
 from datetime import datetime
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, 
-    PageBreak, KeepTogether
-)
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.graphics.shapes import Drawing, Rect, Line, Circle, Polygon, String
+
+# reportlab is imported lazily by _ensure_reportlab() so runs that never
+# build a PDF (e.g. --json --no-pdf) don't pay its import cost
+_REPORTLAB_LOADED = False
+
+def _ensure_reportlab():
+    """Import reportlab names into module globals on first use."""
+    global _REPORTLAB_LOADED
+    global colors, letter, inch, TA_CENTER, TA_LEFT
+    global SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, KeepTogether
+    global getSampleStyleSheet, ParagraphStyle
+    global Drawing, Rect, Line, Circle, Polygon, String, Path, FILL_NON_ZERO, bezierArc
+    global stringWidth
+    global CHAMBER_FILL, REFRACTORY_FILL, FIREBRICK_FILL
+    global TITLE_COLOR, HEADING_COLOR, SUBHEADING_COLOR
+    if _REPORTLAB_LOADED:
+        return
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+    from reportlab.platypus import (
+        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, 
+        PageBreak, KeepTogether
+    )
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.graphics.shapes import Drawing, Rect, Line, Circle, Polygon, String, Path, FILL_NON_ZERO
+    from reportlab.pdfgen.pdfgeom import bezierArc
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    
+    # Diagram material fills, built once rather than per shape
+    CHAMBER_FILL = colors.Color(0.95, 0.95, 0.95)
+    REFRACTORY_FILL = colors.Color(0.9, 0.85, 0.7)
+    FIREBRICK_FILL = colors.Color(0.85, 0.75, 0.6)
+    
+    # Paragraph style text colors
+    TITLE_COLOR = colors.HexColor('#1a1a1a')
+    HEADING_COLOR = colors.HexColor('#2c5aa0')
+    SUBHEADING_COLOR = colors.HexColor('#444444')
+    _REPORTLAB_LOADED = True
 
 # =============================================================================
 # CONFIGURATION & CONSTANTS
@@ -57,6 +90,7 @@ from reportlab.graphics.shapes import Drawing, Rect, Line, Circle, Polygon, Stri
 
 # Refractory properties (Kast-O-Lite 30 LI)
 REFRACTORY_DENSITY_LB_PER_CF = 92  # lb/ft³
+CUBIC_INCHES_PER_CF = 1728
 REFRACTORY_BAG_SIZE_LB = 55
 
 # Engineering constants
@@ -76,13 +110,29 @@ VALID_HEIGHT_RANGE = (3, 12)
 VALID_LENGTH_RANGE = (6, 48)
 VALID_INSULATION_RANGE = (1.0, 3.0)
 
+# (label, range) in the argument order of validate_inputs()
+_VALIDATION_TABLE = (
+    ('Width', VALID_WIDTH_RANGE),
+    ('Height', VALID_HEIGHT_RANGE),
+    ('Length', VALID_LENGTH_RANGE),
+    ('Insulation', VALID_INSULATION_RANGE),
+)
+
+# Diagram dash patterns (shared, read-only)
+DASH_FINE = (3, 2)    # Hidden outlines
+DASH_COARSE = (4, 2)  # Internal baffle
+DASH_HINT = (2, 2)    # Inner shell in schematic
+
 # Debug state
 DEBUG_MODE = False
 
-def debug_log(msg):
-    """Print debug messages if debug mode is enabled."""
+def debug_log(msg, *args):
+    """
+    Print debug messages if debug mode is enabled.
+    Any args are %-formatted into msg only when the message is printed.
+    """
     if DEBUG_MODE:
-        print(f"[DEBUG] {msg}")
+        print("[DEBUG] " + (msg % args if args else msg))
 
 
 # =============================================================================
@@ -173,17 +223,10 @@ def validate_inputs(width, height, length, insulation):
     """
     warnings = []
     
-    if not (VALID_WIDTH_RANGE[0] <= width <= VALID_WIDTH_RANGE[1]):
-        warnings.append(f"Width {width}\" outside typical range ({VALID_WIDTH_RANGE[0]}-{VALID_WIDTH_RANGE[1]}\")")
-    
-    if not (VALID_HEIGHT_RANGE[0] <= height <= VALID_HEIGHT_RANGE[1]):
-        warnings.append(f"Height {height}\" outside typical range ({VALID_HEIGHT_RANGE[0]}-{VALID_HEIGHT_RANGE[1]}\")")
-    
-    if not (VALID_LENGTH_RANGE[0] <= length <= VALID_LENGTH_RANGE[1]):
-        warnings.append(f"Length {length}\" outside typical range ({VALID_LENGTH_RANGE[0]}-{VALID_LENGTH_RANGE[1]}\")")
-    
-    if not (VALID_INSULATION_RANGE[0] <= insulation <= VALID_INSULATION_RANGE[1]):
-        warnings.append(f"Insulation {insulation}\" outside typical range ({VALID_INSULATION_RANGE[0]}-{VALID_INSULATION_RANGE[1]}\")")
+    values = (width, height, length, insulation)
+    for (label, (low, high)), value in zip(_VALIDATION_TABLE, values):
+        if not (low <= value <= high):
+            warnings.append(f"{label} {value}\" outside typical range ({low}-{high}\")")
     
     volume = width * height * length
     if volume < 100:
@@ -191,7 +234,7 @@ def validate_inputs(width, height, length, insulation):
     if volume > 2000:
         warnings.append(f"Very large chamber ({volume} ci) - may need multiple burners")
     
-    debug_log(f"Validation complete: {len(warnings)} warnings")
+    debug_log("Validation complete: %d warnings", len(warnings))
     return warnings
 
 
@@ -199,54 +242,80 @@ def validate_inputs(width, height, length, insulation):
 # ENGINEERING CALCULATOR
 # =============================================================================
 
-def calculate_forge_specs(user_input):
+def calculate_forge_specs(user_input, generated_date=None):
     """
     Calculate all engineering specifications from user input.
     Returns comprehensive specs dictionary.
-    """
-    w = user_input['width']
-    h = user_input['height']
-    l = user_input['length']
-    ins = user_input['insulation']
-    door_config = user_input['door_config']
     
+    generated_date is the timestamp string stamped on the specs; callers
+    producing several designs can pass one in instead of re-reading the
+    clock for each. Defaults to the current time.
+    """
+    specs = dict(_calculate_specs_cached(
+        user_input['width'],
+        user_input['height'],
+        user_input['length'],
+        user_input['insulation'],
+        user_input['door_config']
+    ))
+    if generated_date is None:
+        generated_date = datetime.now().strftime("%Y-%m-%d %H:%M")
+    specs['generated_date'] = generated_date
+    
+    # The cached items are shared; give this caller its own cut list dict
+    specs['steel_cuts'] = dict(specs['steel_cuts'])
+    
+    # Logged here rather than in the cached function so --debug output
+    # doesn't depend on whether the design was already calculated
+    debug_log("Internal volume: %s ci", specs['internal_volume'])
+    debug_log("External dimensions: %s\" x %s\" x %s\"",
+              specs['external_w'], specs['external_h'], specs['external_l'])
+    debug_log("Burner: %s holes (%s x %s), %s\" long", specs['burner_holes'],
+              specs['holes_per_row'], specs['burner_rows'], specs['burner_length'])
+    debug_log("Blower: %s CFM required, %s CFM recommended",
+              specs['cfm_required'], specs['cfm_recommended'])
+    debug_log("Refractory: %s bags (%.1f lb)", specs['refractory_bags'], specs['refractory_weight'])
+    debug_log("Specs calculation complete: %d parameters", len(specs))
+    return specs
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _calculate_specs_cached(w, h, l, ins, door_config):
+    """
+    Pure calculation behind calculate_forge_specs(), memoized on the inputs.
+    Returns the specs as a tuple of (key, value) items.
+    """
     # Internal volume
     internal_volume = w * h * l
-    debug_log(f"Internal volume: {internal_volume} ci")
     
     # External dimensions (insulation on all sides + 1" for plates/frame)
     ext_w = w + (ins * 2) + 0.5  # 1/4" plate each side
     ext_h = h + (ins * 2) + 0.5
     ext_l = l + 1.0  # End plates
     
-    debug_log(f"External dimensions: {ext_w}\" x {ext_h}\" x {ext_l}\"")
+    # Number of 1/4" holes' worth of chamber - drives both burner and blower sizing
+    coverage_ratio = internal_volume / HOLE_COVERAGE_CI
     
     # Burner calculations
-    total_holes = max(MIN_BURNER_HOLES, round(internal_volume / HOLE_COVERAGE_CI))
+    total_holes = max(MIN_BURNER_HOLES, round(coverage_ratio))
     holes_per_row = round(total_holes / BURNER_ROWS)
     total_holes = holes_per_row * BURNER_ROWS  # Ensure divisible by rows
     
     burner_length = round((holes_per_row * HOLE_SPACING) + 1.5, 1)
     burner_width = 3.0  # Standard 3x3 square tube
     
-    debug_log(f"Burner: {total_holes} holes ({holes_per_row} x {BURNER_ROWS}), {burner_length}\" long")
-    
     # Blower/CFM calculations
-    cfm_required = round((internal_volume / HOLE_COVERAGE_CI) * 1.2)
+    cfm_required = round(coverage_ratio * 1.2)
     cfm_recommended = round(cfm_required * 1.25)  # 25% safety margin
     static_pressure = "1.5" if internal_volume < 500 else "3.0"
     
-    debug_log(f"Blower: {cfm_required} CFM required, {cfm_recommended} CFM recommended")
-    
     # Refractory calculations
     external_volume_ci = ext_w * ext_h * ext_l
     refractory_volume_ci = external_volume_ci - internal_volume
-    refractory_volume_cf = refractory_volume_ci / 1728  # Convert to cubic feet
-    refractory_weight_lb = refractory_volume_cf * REFRACTORY_DENSITY_LB_PER_CF
+    # Keep this divide-then-multiply order: folding the constants into one
+    # factor shifts the last bit and can flip the rounded bag count
+    refractory_weight_lb = refractory_volume_ci / CUBIC_INCHES_PER_CF * REFRACTORY_DENSITY_LB_PER_CF
     refractory_bags = round(refractory_weight_lb / REFRACTORY_BAG_SIZE_LB, 1)
     
-    debug_log(f"Refractory: {refractory_bags} bags ({refractory_weight_lb:.1f} lb)")
-    
     # Door sizing (proportional to chamber)
     front_door_w = round(w * 0.85, 1)  # 85% of internal width
     front_door_h = round(h * 0.85, 1)
@@ -319,46 +388,114 @@ def calculate_forge_specs(user_input):
         # Performance
         'btu_required': btu_required,
         'estimated_cost': estimated_cost,
-        
-        # Metadata
-        'generated_date': datetime.now().strftime("%Y-%m-%d %H:%M"),
     }
     
-    debug_log(f"Specs calculation complete: {len(specs)} parameters")
-    return specs
+    return tuple(specs.items())
 
+# Steel cut list rows (note is only set on panels that need extra work)
+Cut = namedtuple('Cut', 'name qty w h thickness note')
+Cut.__new__.__defaults__ = (None,)
+Angle = namedtuple('Angle', 'name qty length size')
 def calculate_steel_cuts(ext_w, ext_h, ext_l, door_w, door_h):
-    """Generate steel plate cut list based on dimensions."""
-    cuts = [
-        {'name': 'Side Panels', 'qty': 2, 'w': ext_l, 'h': ext_h, 'thickness': '1/4"'},
-        {'name': 'Top Panel', 'qty': 1, 'w': ext_l, 'h': ext_w, 'thickness': '1/4"'},
-        {'name': 'Bottom Panel', 'qty': 1, 'w': ext_l, 'h': ext_w, 'thickness': '1/4"'},
-        {'name': 'Front End Panel', 'qty': 1, 'w': ext_w, 'h': ext_h, 'thickness': '1/4"',
-         'note': f'Cut {door_w}"x{door_h}" door opening'},
-        {'name': 'Rear End Panel', 'qty': 1, 'w': ext_w, 'h': ext_h, 'thickness': '1/4"'},
-    ]
+    """
+    Generate steel plate cut list based on dimensions.
+    The rows are cached immutable tuples; every call gets its own dict.
+    """
+    plates, angle_iron = _steel_cut_rows(ext_w, ext_h, ext_l, door_w, door_h)
+    return {'plates': plates, 'angle_iron': angle_iron}
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _steel_cut_rows(ext_w, ext_h, ext_l, door_w, door_h):
+    """Memoized (plates, angle_iron) rows behind calculate_steel_cuts()."""
+    cuts = (
+        Cut('Side Panels', 2, ext_l, ext_h, '1/4"'),
+        Cut('Top Panel', 1, ext_l, ext_w, '1/4"'),
+        Cut('Bottom Panel', 1, ext_l, ext_w, '1/4"'),
+        Cut('Front End Panel', 1, ext_w, ext_h, '1/4"',
+            f'Cut {door_w}"x{door_h}" door opening'),
+        Cut('Rear End Panel', 1, ext_w, ext_h, '1/4"'),
+    )
     
     # Angle iron for frame
-    angle_cuts = [
-        {'name': 'Corner Posts', 'qty': 4, 'length': ext_h, 'size': '2" x 2" x 1/8"'},
-        {'name': 'Top/Bottom Rails', 'qty': 8, 'length': ext_l - 4, 'size': '2" x 2" x 1/8"'},
-        {'name': 'End Rails', 'qty': 8, 'length': ext_w - 4, 'size': '2" x 2" x 1/8"'},
-    ]
+    angle_cuts = (
+        Angle('Corner Posts', 4, ext_h, '2" x 2" x 1/8"'),
+        Angle('Top/Bottom Rails', 8, ext_l - 4, '2" x 2" x 1/8"'),
+        Angle('End Rails', 8, ext_w - 4, '2" x 2" x 1/8"'),
+    )
     
-    return {'plates': cuts, 'angle_iron': angle_cuts}
+    return cuts, angle_cuts
+
+def specs_for_json(specs):
+    """Return a copy of specs with the steel cut rows expanded back into dicts."""
+    out = dict(specs)
+    out['steel_cuts'] = {
+        group: [{k: v for k, v in row._asdict().items() if v is not None} for row in rows]
+        for group, rows in specs['steel_cuts'].items()
+    }
+    return out
+
+def pdf_filename(specs):
+    """Build guide filename; named by volume, so equal volumes share a file."""
+    return f"Forge_Build_Guide_{int(specs['internal_volume'])}ci.pdf"
+
+def json_filename(specs):
+    """JSON export filename, named by volume like the PDF."""
+    return f"forge_specs_{int(specs['internal_volume'])}ci.json"
 
 
 # =============================================================================
 # DYNAMIC DIAGRAM GENERATOR
 # =============================================================================
 
+@functools.lru_cache(maxsize=512)
+def text_width(text, fontsize, font=None):
+    """
+    Width of text in points, cached since diagram labels repeat across builds.
+    font defaults to the one String uses when none is given (Times-Roman).
+    """
+    _ensure_reportlab()
+    if font is None:
+        from reportlab import rl_config
+        font = rl_config.defaultGraphicsFontName
+    return stringWidth(text, font, fontsize)
+
+def draw_lines(d, segments, strokeColor, strokeWidth, strokeDashArray=None):
+    """
+    Add (x1, y1, x2, y2) segments sharing one stroke style as a single Path.
+    Added at the call site, so paint order relative to other shapes is kept.
+    """
+    if not segments:
+        return
+    p = Path(fillColor=None, strokeColor=strokeColor, strokeWidth=strokeWidth,
+             strokeDashArray=strokeDashArray)
+    for x1, y1, x2, y2 in segments:
+        p.moveTo(x1, y1)
+        p.lineTo(x2, y2)
+    d.add(p)
+
+def draw_circles(d, centers, r, fillColor=None, strokeColor=None, strokeWidth=1):
+    """
+    Add identical circles at (x, y) centers as a single Path, using the same
+    Bezier arcs reportlab draws a Circle with. Overlapping circles fill as a union.
+    """
+    if not centers:
+        return
+    p = Path(fillColor=fillColor, strokeColor=strokeColor, strokeWidth=strokeWidth,
+             fillMode=FILL_NON_ZERO)
+    for cx, cy in centers:
+        curves = bezierArc(cx - r, cy - r, cx + r, cy + r, 0, 360)
+        p.moveTo(*curves[0][:2])
+        for curve in curves:
+            p.curveTo(*curve[2:])
+        p.closePath()
+    d.add(p)
+
 def draw_dimension_line(d, x1, y1, x2, y2, label, offset=15, fontsize=8):
     """Draw a proper dimension line with arrows and label."""
-    import math
     # Calculate angle and perpendicular offset
     dx, dy = x2 - x1, y2 - y1
-    length = math.sqrt(dx*dx + dy*dy)
-    if length == 0:
+    length = math.hypot(dx, dy)
+    if length < 2:  # Too short to show anything legible
         return
     ux, uy = dx/length, dy/length  # Unit vector along line
     px, py = -uy, ux  # Perpendicular unit vector
@@ -367,32 +504,35 @@ def draw_dimension_line(d, x1, y1, x2, y2, label, offset=15, fontsize=8):
     ox1, oy1 = x1 + px*offset, y1 + py*offset
     ox2, oy2 = x2 + px*offset, y2 + py*offset
     
-    # Extension lines
-    d.add(Line(x1, y1, ox1, oy1, strokeColor=colors.black, strokeWidth=0.5))
-    d.add(Line(x2, y2, ox2, oy2, strokeColor=colors.black, strokeWidth=0.5))
-    
-    # Main dimension line
-    d.add(Line(ox1, oy1, ox2, oy2, strokeColor=colors.black, strokeWidth=0.5))
+    # Extension lines and main dimension line
+    draw_lines(d, [
+        (x1, y1, ox1, oy1),
+        (x2, y2, ox2, oy2),
+        (ox1, oy1, ox2, oy2),
+    ], colors.black, 0.5)
     
-    # Arrow heads (simple ticks at 45 degrees)
+    # Arrow heads (simple ticks at 45 degrees), left off short dimensions
+    # where the two heads would run into each other
     arrow_size = 4
-    # Start arrow
-    d.add(Line(ox1, oy1, ox1 + ux*arrow_size + px*arrow_size*0.3, oy1 + uy*arrow_size + py*arrow_size*0.3, 
-               strokeColor=colors.black, strokeWidth=0.75))
-    d.add(Line(ox1, oy1, ox1 + ux*arrow_size - px*arrow_size*0.3, oy1 + uy*arrow_size - py*arrow_size*0.3, 
-               strokeColor=colors.black, strokeWidth=0.75))
-    # End arrow
-    d.add(Line(ox2, oy2, ox2 - ux*arrow_size + px*arrow_size*0.3, oy2 - uy*arrow_size + py*arrow_size*0.3, 
-               strokeColor=colors.black, strokeWidth=0.75))
-    d.add(Line(ox2, oy2, ox2 - ux*arrow_size - px*arrow_size*0.3, oy2 - uy*arrow_size - py*arrow_size*0.3, 
-               strokeColor=colors.black, strokeWidth=0.75))
+    if length >= 4 * arrow_size:
+        ax, ay = ux*arrow_size, uy*arrow_size  # Along the line
+        bx, by = px*arrow_size*0.3, py*arrow_size*0.3  # Tick spread
+        draw_lines(d, [
+            # Start arrow
+            (ox1, oy1, ox1 + ax + bx, oy1 + ay + by),
+            (ox1, oy1, ox1 + ax - bx, oy1 + ay - by),
+            # End arrow
+            (ox2, oy2, ox2 - ax + bx, oy2 - ay + by),
+            (ox2, oy2, ox2 - ax - bx, oy2 - ay - by),
+        ], colors.black, 0.75)
     
     # Label at midpoint
     mx, my = (ox1 + ox2) / 2, (oy1 + oy2) / 2
-    d.add(String(mx - len(label)*2, my + 3, label, fontSize=fontsize, fillColor=colors.black))
+    d.add(String(mx - text_width(label, fontsize)/2, my + 3, label, fontSize=fontsize, fillColor=colors.black))
 
 def draw_forge_body_isometric(specs, width_px=450, height_px=320):
     """Create architectural orthographic views of forge body."""
+    _ensure_reportlab()
     d = Drawing(width_px, height_px)
     
     w = specs['external_w']
@@ -415,8 +555,8 @@ def draw_forge_body_isometric(specs, width_px=450, height_px=320):
     # Inner chamber (dashed)
     ins_px = ins * scale
     d.add(Rect(fx + ins_px, fy + ins_px, fw - 2*ins_px, fh - 2*ins_px, 
-               fillColor=colors.Color(0.95, 0.95, 0.95), strokeColor=colors.black, 
-               strokeWidth=0.5, strokeDashArray=[3, 2]))
+               fillColor=CHAMBER_FILL, strokeColor=colors.black, 
+               strokeWidth=0.5, strokeDashArray=DASH_FINE))
     
     # Door opening
     door_px_w = door_w * scale
@@ -428,21 +568,21 @@ def draw_forge_body_isometric(specs, width_px=450, height_px=320):
     
     # Cross-hatch the insulation area (top strip)
     hatch_spacing = 6
-    for i in range(int(fw / hatch_spacing) + 5):
-        hx = fx + i * hatch_spacing
-        # Top insulation hatch
-        d.add(Line(hx, fy + fh - ins_px, hx + ins_px, fy + fh, 
-                   strokeColor=colors.grey, strokeWidth=0.3))
+    hatch_xs = [fx + i * hatch_spacing for i in range(int(fw / hatch_spacing) + 5)]
+    # Top insulation hatch
+    draw_lines(d, [(hx, fy + fh - ins_px, hx + ins_px, fy + fh) for hx in hatch_xs],
+               colors.grey, 0.3)
     
     # Front view dimensions
     draw_dimension_line(d, fx, fy, fx + fw, fy, f'{w:.1f}"', offset=-18)
     draw_dimension_line(d, fx, fy, fx, fy + fh, f'{h:.1f}"', offset=-18)
     
     # Door dimension
-    d.add(String(door_x + door_px_w/2 - 15, door_y + door_px_h/2, f'{door_w:.1f}"×{door_h:.1f}"', 
+    door_label = f'{door_w:.1f}"×{door_h:.1f}"'
+    d.add(String(door_x + door_px_w/2 - text_width(door_label, 7)/2, door_y + door_px_h/2, door_label, 
                  fontSize=7, fillColor=colors.black))
     
-    d.add(String(fx + fw/2 - 25, fy + fh + 25, 'FRONT VIEW', fontSize=9, fillColor=colors.black))
+    d.add(String(fx + fw/2 - text_width('FRONT VIEW', 9)/2, fy + fh + 25, 'FRONT VIEW', fontSize=9, fillColor=colors.black))
     
     # === SIDE VIEW (right side) ===
     sx, sy = 260, 80  # Side view origin
@@ -454,8 +594,8 @@ def draw_forge_body_isometric(specs, width_px=450, height_px=320):
     # Inner chamber
     ins_px_side = ins * scale * 0.6
     d.add(Rect(sx + ins_px_side, sy + ins_px, sw - 2*ins_px_side, sh - 2*ins_px, 
-               fillColor=colors.Color(0.95, 0.95, 0.95), strokeColor=colors.black, 
-               strokeWidth=0.5, strokeDashArray=[3, 2]))
+               fillColor=CHAMBER_FILL, strokeColor=colors.black, 
+               strokeWidth=0.5, strokeDashArray=DASH_FINE))
     
     # Burner position indicator (on top)
     burner_x = sx + sw * 0.4
@@ -466,17 +606,18 @@ def draw_forge_body_isometric(specs, width_px=450, height_px=320):
     # Side view dimensions
     draw_dimension_line(d, sx, sy, sx + sw, sy, f'{l:.1f}"', offset=-18)
     
-    d.add(String(sx + sw/2 - 20, sy + sh + 25, 'SIDE VIEW', fontSize=9, fillColor=colors.black))
+    d.add(String(sx + sw/2 - text_width('SIDE VIEW', 9)/2, sy + sh + 25, 'SIDE VIEW', fontSize=9, fillColor=colors.black))
     
     # Title block
     d.add(Line(10, 15, width_px - 10, 15, strokeColor=colors.black, strokeWidth=0.5))
-    d.add(String(width_px/2 - 80, 5, f'FORGE BODY - EXTERNAL: {w:.1f}" × {h:.1f}" × {l:.1f}"', 
-                 fontSize=9, fillColor=colors.black))
+    title = f'FORGE BODY - EXTERNAL: {w:.1f}" × {h:.1f}" × {l:.1f}"'
+    d.add(String(width_px/2 - text_width(title, 9)/2, 5, title, fontSize=9, fillColor=colors.black))
     
     return d
 
 def draw_burner_detail(specs, width_px=450, height_px=280):
     """Create architectural section view of ribbon burner."""
+    _ensure_reportlab()
     d = Drawing(width_px, height_px)
     
     burner_len = specs['burner_length']
@@ -500,15 +641,14 @@ def draw_burner_detail(specs, width_px=450, height_px=280):
     
     # Refractory layer at bottom
     refr_h = 15
-    d.add(Rect(x + wall, y + wall, w - 2*wall, refr_h, fillColor=colors.Color(0.9, 0.85, 0.7), 
+    d.add(Rect(x + wall, y + wall, w - 2*wall, refr_h, fillColor=REFRACTORY_FILL, 
                strokeColor=colors.black, strokeWidth=0.5))
     
     # Cross-hatch the refractory
-    for i in range(int(w / 8) + 2):
-        hx = x + wall + i * 8
-        if hx < x + w - wall:
-            d.add(Line(hx, y + wall, min(hx + refr_h, x + w - wall), y + wall + min(refr_h, x + w - wall - hx), 
-                       strokeColor=colors.grey, strokeWidth=0.3))
+    hatch_xs = [x + wall + i * 8 for i in range(int(w / 8) + 2)]
+    draw_lines(d, [(hx, y + wall, min(hx + refr_h, x + w - wall), y + wall + min(refr_h, x + w - wall - hx))
+                   for hx in hatch_xs if hx < x + w - wall],
+               colors.grey, 0.3)
     
     # Air inlet pipe (left side)
     pipe_w, pipe_h = 25, 18
@@ -526,7 +666,7 @@ def draw_burner_detail(specs, width_px=450, height_px=280):
     # Internal baffle
     baffle_x = x + 20
     d.add(Line(baffle_x, y + wall + refr_h, baffle_x, y + h - wall, 
-               strokeColor=colors.black, strokeWidth=1, strokeDashArray=[4, 2]))
+               strokeColor=colors.black, strokeWidth=1, strokeDashArray=DASH_COARSE))
     
     # Dimension lines
     draw_dimension_line(d, x, y + h + 5, x + w, y + h + 5, f'{burner_len}"', offset=12)
@@ -539,44 +679,45 @@ def draw_burner_detail(specs, width_px=450, height_px=280):
     d.add(Line(gas_x + 5, gas_y + 12, gas_x + 25, gas_y + 20, strokeColor=colors.black, strokeWidth=0.5))
     d.add(String(gas_x + 27, gas_y + 17, '1/4" GAS', fontSize=7, fillColor=colors.black))
     
-    d.add(String(x + w/2 - 25, y + wall + 5, 'REFRACTORY', fontSize=6, fillColor=colors.black))
+    d.add(String(x + w/2 - text_width('REFRACTORY', 6)/2, y + wall + 5, 'REFRACTORY', fontSize=6, fillColor=colors.black))
     
     # Section indicator
     d.add(String(x - 15, y + h/2, 'A', fontSize=10, fillColor=colors.black))
     d.add(String(x + w + 8, y + h/2, 'A', fontSize=10, fillColor=colors.black))
     
-    d.add(String(x + w/2 - 40, y + h + 35, 'SECTION A-A: LONGITUDINAL', fontSize=8, fillColor=colors.black))
+    d.add(String(x + w/2 - text_width('SECTION A-A: LONGITUDINAL', 8)/2, y + h + 35, 'SECTION A-A: LONGITUDINAL', fontSize=8, fillColor=colors.black))
     
     # === BOTTOM VIEW (hole pattern) ===
     bx, by = 80, 40
     bw, bh = w, 50
     
-    d.add(Rect(bx, by, bw, bh, fillColor=colors.Color(0.9, 0.85, 0.7), strokeColor=colors.black, strokeWidth=1))
+    d.add(Rect(bx, by, bw, bh, fillColor=REFRACTORY_FILL, strokeColor=colors.black, strokeWidth=1))
     
     # Draw flame holes in pattern
     hole_radius = 2.5
     hole_spacing_px = (bw - 20) / max(1, holes_per_row - 1)
     row_spacing = bh / (rows + 1)
     
-    for row in range(rows):
-        row_offset = (row % 2) * (hole_spacing_px / 2) * 0.3  # Stagger
-        for col in range(holes_per_row):
-            hole_x = bx + 10 + col * hole_spacing_px + row_offset
-            hole_y = by + row_spacing * (row + 1)
-            if hole_x < bx + bw - 5:
-                d.add(Circle(hole_x, hole_y, hole_radius, fillColor=colors.black, strokeColor=colors.black))
+    col_xs = [bx + 10 + col * hole_spacing_px for col in range(holes_per_row)]
+    row_offsets = [(row % 2) * (hole_spacing_px / 2) * 0.3 for row in range(rows)]  # Stagger
+    hole_centers = [(cx + row_offsets[row], by + row_spacing * (row + 1))
+                    for row in range(rows) for cx in col_xs
+                    if cx + row_offsets[row] < bx + bw - 5]
+    draw_circles(d, hole_centers, hole_radius, fillColor=colors.black, strokeColor=colors.black)
     
-    d.add(String(bx + bw/2 - 50, by - 12, f'BOTTOM VIEW: {holes} × 1/4" HOLES ({rows}×{holes_per_row})', 
+    bottom_label = f'BOTTOM VIEW: {holes} × 1/4" HOLES ({rows}×{holes_per_row})'
+    d.add(String(bx + bw/2 - text_width(bottom_label, 7)/2, by - 12, bottom_label, 
                  fontSize=7, fillColor=colors.black))
     
     # Title block
     d.add(Line(10, 15, width_px - 10, 15, strokeColor=colors.black, strokeWidth=0.5))
-    d.add(String(width_px/2 - 60, 5, 'RIBBON BURNER ASSEMBLY', fontSize=9, fillColor=colors.black))
+    d.add(String(width_px/2 - text_width('RIBBON BURNER ASSEMBLY', 9)/2, 5, 'RIBBON BURNER ASSEMBLY', fontSize=9, fillColor=colors.black))
     
     return d
 
 def draw_door_system(specs, width_px=400, height_px=280):
     """Create architectural detail of sliding door system."""
+    _ensure_reportlab()
     d = Drawing(width_px, height_px)
     
     door_w = specs['front_door_w']
@@ -603,12 +744,11 @@ def draw_door_system(specs, width_px=400, height_px=280):
     d.add(Rect(open_x, open_y, opening_w, opening_h, fillColor=colors.white, strokeColor=colors.black, strokeWidth=1))
     
     # Hatch the forge face (section lines)
-    for i in range(int(face_w / 10) + 3):
-        hx = x + i * 10
-        if hx < x + face_w:
-            # Only draw where not opening
-            if hx < open_x or hx > open_x + opening_w:
-                d.add(Line(hx, y, hx + 5, y + 5, strokeColor=colors.grey, strokeWidth=0.25))
+    hatch_xs = [x + i * 10 for i in range(int(face_w / 10) + 3)]
+    # Only draw where not opening
+    draw_lines(d, [(hx, y, hx + 5, y + 5) for hx in hatch_xs
+                   if hx < x + face_w and (hx < open_x or hx > open_x + opening_w)],
+               colors.grey, 0.25)
     
     # Track rod (above opening)
     rod_y = y + face_h + 8
@@ -616,8 +756,8 @@ def draw_door_system(specs, width_px=400, height_px=280):
     d.add(Line(open_x - track_extend, rod_y, open_x + opening_w + track_extend, rod_y, 
                strokeColor=colors.black, strokeWidth=1.5))
     # Rod end circles
-    d.add(Circle(open_x - track_extend, rod_y, 3, fillColor=None, strokeColor=colors.black, strokeWidth=1))
-    d.add(Circle(open_x + opening_w + track_extend, rod_y, 3, fillColor=None, strokeColor=colors.black, strokeWidth=1))
+    draw_circles(d, [(open_x - track_extend, rod_y), (open_x + opening_w + track_extend, rod_y)], 3,
+                 strokeColor=colors.black, strokeWidth=1)
     
     # Rod supports (triangular brackets)
     for bracket_x in [open_x - 5, open_x + opening_w + 5]:
@@ -628,7 +768,7 @@ def draw_door_system(specs, width_px=400, height_px=280):
     draw_dimension_line(d, open_x, open_y - 5, open_x + opening_w, open_y - 5, f'{door_w:.1f}"', offset=-15)
     draw_dimension_line(d, open_x - 5, open_y, open_x - 5, open_y + opening_h, f'{door_h:.1f}"', offset=-15)
     
-    d.add(String(x + face_w/2 - 30, y + face_h + 25, 'FRONT ELEVATION', fontSize=8, fillColor=colors.black))
+    d.add(String(x + face_w/2 - text_width('FRONT ELEVATION', 8)/2, y + face_h + 25, 'FRONT ELEVATION', fontSize=8, fillColor=colors.black))
     
     # === SECTION DETAIL (right side) ===
     sx, sy = 250, 60
@@ -637,10 +777,9 @@ def draw_door_system(specs, width_px=400, height_px=280):
     wall_t = 15
     d.add(Rect(sx, sy, wall_t, face_h, fillColor=None, strokeColor=colors.black, strokeWidth=1))
     # Cross hatch the wall
-    for i in range(int(face_h / 6) + 2):
-        hy = sy + i * 6
-        if hy < sy + face_h:
-            d.add(Line(sx, hy, sx + wall_t, hy + wall_t*0.7, strokeColor=colors.grey, strokeWidth=0.3))
+    hatch_ys = [sy + i * 6 for i in range(int(face_h / 6) + 2)]
+    draw_lines(d, [(sx, hy, sx + wall_t, hy + wall_t*0.7) for hy in hatch_ys if hy < sy + face_h],
+               colors.grey, 0.3)
     
     # Track rod (circle in section)
     rod_sx = sx + wall_t + 20
@@ -660,7 +799,7 @@ def draw_door_system(specs, width_px=400, height_px=280):
                fillColor=None, strokeColor=colors.black, strokeWidth=1))
     # Firebrick inside
     d.add(Rect(rod_sx - hanger_w/2 + 3, sy + (face_h - door_h_px)/2 + 3, door_t - 6, door_h_px - 6, 
-               fillColor=colors.Color(0.85, 0.75, 0.6), strokeColor=colors.black, strokeWidth=0.5))
+               fillColor=FIREBRICK_FILL, strokeColor=colors.black, strokeWidth=0.5))
     d.add(String(rod_sx - 5, sy + face_h/2, 'IFB', fontSize=6, fillColor=colors.black))
     
     # Movement arrow
@@ -674,12 +813,13 @@ def draw_door_system(specs, width_px=400, height_px=280):
     
     # Title block
     d.add(Line(10, 15, width_px - 10, 15, strokeColor=colors.black, strokeWidth=0.5))
-    d.add(String(width_px/2 - 70, 5, 'SLIDING FIREBRICK DOOR DETAIL', fontSize=9, fillColor=colors.black))
+    d.add(String(width_px/2 - text_width('SLIDING FIREBRICK DOOR DETAIL', 9)/2, 5, 'SLIDING FIREBRICK DOOR DETAIL', fontSize=9, fillColor=colors.black))
     
     return d
 
 def draw_assembly_overview(specs, width_px=480, height_px=350):
     """Create schematic assembly overview with proper piping."""
+    _ensure_reportlab()
     d = Drawing(width_px, height_px)
     
     pipe_thickness = 6  # Visual thickness for 1.5" pipe representation
@@ -692,7 +832,7 @@ def draw_assembly_overview(specs, width_px=480, height_px=350):
     # Forge shell (double line for wall thickness)
     d.add(Rect(forge_x, forge_y, forge_w, forge_h, fillColor=None, strokeColor=colors.black, strokeWidth=1.5))
     d.add(Rect(forge_x + 5, forge_y + 5, forge_w - 10, forge_h - 10, fillColor=colors.white, 
-               strokeColor=colors.black, strokeWidth=0.5, strokeDashArray=[2, 2]))
+               strokeColor=colors.black, strokeWidth=0.5, strokeDashArray=DASH_HINT))
     
     # Stand legs
     leg_h = 70
@@ -728,25 +868,27 @@ def draw_assembly_overview(specs, width_px=480, height_px=350):
     # Elbow position - above burner center
     elbow_x = burner_x + burner_w/2
     
-    # Draw pipe as parallel lines (showing tube walls)
-    # Vertical section from blower up
-    d.add(Line(pipe_start_x, pipe_start_y, pipe_start_x, pipe_rise_top, strokeColor=colors.black, strokeWidth=1))
-    d.add(Line(pipe_start_x - pipe_thickness, pipe_start_y, pipe_start_x - pipe_thickness, pipe_rise_top, strokeColor=colors.black, strokeWidth=1))
-    
-    # Top elbow (vertical to horizontal) - proper squared corner
-    d.add(Line(pipe_start_x - pipe_thickness, pipe_rise_top, pipe_start_x, pipe_rise_top, strokeColor=colors.black, strokeWidth=1))
-    
-    # Horizontal section running left toward elbow down to burner
-    # Top line of horizontal pipe (extends all the way to outer edge of elbow)
-    d.add(Line(pipe_start_x - pipe_thickness, pipe_rise_top, elbow_x, pipe_rise_top, strokeColor=colors.black, strokeWidth=1))
-    # Bottom line of horizontal pipe (stops at inner corner)
-    d.add(Line(pipe_start_x - pipe_thickness, pipe_rise_top - pipe_thickness, elbow_x + pipe_thickness, pipe_rise_top - pipe_thickness, strokeColor=colors.black, strokeWidth=1))
-    
-    # Elbow down into burner - proper squared 90-degree corner
-    # Outer line (left side) goes straight down from end of top horizontal line
-    d.add(Line(elbow_x, pipe_rise_top, elbow_x, burner_y + burner_h, strokeColor=colors.black, strokeWidth=1))
-    # Inner line (right side) goes down from where bottom horizontal ended
-    d.add(Line(elbow_x + pipe_thickness, pipe_rise_top - pipe_thickness, elbow_x + pipe_thickness, burner_y + burner_h, strokeColor=colors.black, strokeWidth=1))
+    # Draw pipe as parallel lines (showing tube walls), all walls in one Path
+    draw_lines(d, [
+        # Vertical section from blower up
+        (pipe_start_x, pipe_start_y, pipe_start_x, pipe_rise_top),
+        (pipe_start_x - pipe_thickness, pipe_start_y, pipe_start_x - pipe_thickness, pipe_rise_top),
+        
+        # Top elbow (vertical to horizontal) - proper squared corner
+        (pipe_start_x - pipe_thickness, pipe_rise_top, pipe_start_x, pipe_rise_top),
+        
+        # Horizontal section running left toward elbow down to burner
+        # Top line of horizontal pipe (extends all the way to outer edge of elbow)
+        (pipe_start_x - pipe_thickness, pipe_rise_top, elbow_x, pipe_rise_top),
+        # Bottom line of horizontal pipe (stops at inner corner)
+        (pipe_start_x - pipe_thickness, pipe_rise_top - pipe_thickness, elbow_x + pipe_thickness, pipe_rise_top - pipe_thickness),
+        
+        # Elbow down into burner - proper squared 90-degree corner
+        # Outer line (left side) goes straight down from end of top horizontal line
+        (elbow_x, pipe_rise_top, elbow_x, burner_y + burner_h),
+        # Inner line (right side) goes down from where bottom horizontal ended
+        (elbow_x + pipe_thickness, pipe_rise_top - pipe_thickness, elbow_x + pipe_thickness, burner_y + burner_h),
+    ], colors.black, 1)
     
     # === GAS PIPE (1/4" - injects into vertical air pipe section) ===
     # Propane tank position (rear/right side, beyond blower)
@@ -763,21 +905,23 @@ def draw_assembly_overview(specs, width_px=480, height_px=350):
     # Gas line path: tank -> UP -> horizontal LEFT (above blower) -> DOWN to T into air pipe
     gas_rise_y = blower_y + 55  # Height to clear above the blower
     
-    # Vertical rise from tank
-    d.add(Line(tank_x + tank_w/2, tank_y + tank_h + 6, tank_x + tank_w/2, gas_rise_y, strokeColor=colors.black, strokeWidth=0.75))
-    d.add(Line(tank_x + tank_w/2 - gas_pipe_thickness, tank_y + tank_h + 6, tank_x + tank_w/2 - gas_pipe_thickness, gas_rise_y, strokeColor=colors.black, strokeWidth=0.75))
-    
-    # Horizontal run above blower to above air pipe
-    d.add(Line(tank_x + tank_w/2, gas_rise_y, pipe_start_x + 5, gas_rise_y, strokeColor=colors.black, strokeWidth=0.75))
-    d.add(Line(tank_x + tank_w/2 - gas_pipe_thickness, gas_rise_y - gas_pipe_thickness, pipe_start_x + 5 - gas_pipe_thickness, gas_rise_y - gas_pipe_thickness, strokeColor=colors.black, strokeWidth=0.75))
-    
-    # Vertical down to injection point on air pipe
-    d.add(Line(pipe_start_x + 5, gas_rise_y - gas_pipe_thickness, pipe_start_x + 5, gas_inject_y, strokeColor=colors.black, strokeWidth=0.75))
-    d.add(Line(pipe_start_x + 5 - gas_pipe_thickness, gas_rise_y - gas_pipe_thickness, pipe_start_x + 5 - gas_pipe_thickness, gas_inject_y, strokeColor=colors.black, strokeWidth=0.75))
-    
-    # T-junction into air pipe (horizontal stub into the vertical pipe)
-    d.add(Line(pipe_start_x + 5 - gas_pipe_thickness, gas_inject_y, pipe_start_x, gas_inject_y, strokeColor=colors.black, strokeWidth=0.75))
-    d.add(Line(pipe_start_x + 5 - gas_pipe_thickness, gas_inject_y - gas_pipe_thickness, pipe_start_x, gas_inject_y - gas_pipe_thickness, strokeColor=colors.black, strokeWidth=0.75))
+    draw_lines(d, [
+        # Vertical rise from tank
+        (tank_x + tank_w/2, tank_y + tank_h + 6, tank_x + tank_w/2, gas_rise_y),
+        (tank_x + tank_w/2 - gas_pipe_thickness, tank_y + tank_h + 6, tank_x + tank_w/2 - gas_pipe_thickness, gas_rise_y),
+        
+        # Horizontal run above blower to above air pipe
+        (tank_x + tank_w/2, gas_rise_y, pipe_start_x + 5, gas_rise_y),
+        (tank_x + tank_w/2 - gas_pipe_thickness, gas_rise_y - gas_pipe_thickness, pipe_start_x + 5 - gas_pipe_thickness, gas_rise_y - gas_pipe_thickness),
+        
+        # Vertical down to injection point on air pipe
+        (pipe_start_x + 5, gas_rise_y - gas_pipe_thickness, pipe_start_x + 5, gas_inject_y),
+        (pipe_start_x + 5 - gas_pipe_thickness, gas_rise_y - gas_pipe_thickness, pipe_start_x + 5 - gas_pipe_thickness, gas_inject_y),
+        
+        # T-junction into air pipe (horizontal stub into the vertical pipe)
+        (pipe_start_x + 5 - gas_pipe_thickness, gas_inject_y, pipe_start_x, gas_inject_y),
+        (pipe_start_x + 5 - gas_pipe_thickness, gas_inject_y - gas_pipe_thickness, pipe_start_x, gas_inject_y - gas_pipe_thickness),
+    ], colors.black, 0.75)
     # T-junction symbol on air pipe
     d.add(Line(pipe_start_x, gas_inject_y + 2, pipe_start_x, gas_inject_y - gas_pipe_thickness - 2, strokeColor=colors.black, strokeWidth=1.5))
     
@@ -798,10 +942,10 @@ def draw_assembly_overview(specs, width_px=480, height_px=350):
     # In side view, door opening appears as a vertical slot on the front face
     door_slot_h = forge_h - 20
     d.add(Rect(forge_x - 2, forge_y + 10, 4, door_slot_h, fillColor=None, strokeColor=colors.black, 
-               strokeWidth=0.75, strokeDashArray=[3, 2]))
+               strokeWidth=0.75, strokeDashArray=DASH_FINE))
     
     # === LABELS ===
-    d.add(String(forge_x + forge_w/2 - 18, forge_y + forge_h/2 - 5, 'FORGE', fontSize=9, fillColor=colors.black))
+    d.add(String(forge_x + forge_w/2 - text_width('FORGE', 9)/2, forge_y + forge_h/2 - 5, 'FORGE', fontSize=9, fillColor=colors.black))
     d.add(String(burner_x + 8, burner_y + 6, 'BURNER', fontSize=6, fillColor=colors.black))
     d.add(String(blower_x - 15, blower_y - 30, 'BLOWER', fontSize=7, fillColor=colors.black))
     d.add(String(blower_x - 22, blower_y - 40, f'{specs["cfm_recommended"]} CFM', fontSize=6, fillColor=colors.black))
@@ -824,12 +968,22 @@ def draw_assembly_overview(specs, width_px=480, height_px=350):
     
     # === TITLE BLOCK ===
     d.add(Line(10, height_px - 22, width_px - 10, height_px - 22, strokeColor=colors.black, strokeWidth=0.5))
-    d.add(String(width_px/2 - 55, height_px - 18, 'SYSTEM SCHEMATIC', fontSize=10, fillColor=colors.black))
+    d.add(String(width_px/2 - text_width('SYSTEM SCHEMATIC', 10)/2, height_px - 18, 'SYSTEM SCHEMATIC', fontSize=10, fillColor=colors.black))
     
     return d
 
 def draw_corner_detail(width_px=400, height_px=280):
-    """Create architectural section detail of bolted corner assembly."""
+    """
+    Create architectural section detail of bolted corner assembly.
+    The detail doesn't depend on specs, so it is built once per size and each
+    call gets a fresh Drawing sharing the cached shapes - treat them as read-only.
+    """
+    return _draw_corner_detail_cached(width_px, height_px).copy()
+
+@functools.lru_cache(maxsize=8)
+def _draw_corner_detail_cached(width_px, height_px):
+    """Build the corner detail drawing (see draw_corner_detail)."""
+    _ensure_reportlab()
     d = Drawing(width_px, height_px)
     
     # === SECTION VIEW ===
@@ -845,13 +999,10 @@ def draw_corner_detail(width_px=400, height_px=280):
     d.add(Rect(x, y, angle_leg, angle_t, fillColor=None, strokeColor=colors.black, strokeWidth=1))
     
     # Cross-hatch the angle iron
-    for i in range(int(angle_leg / 5)):
-        hy = y + i * 5
-        if hy < y + angle_leg:
-            d.add(Line(x, hy, x + angle_t, hy + 3, strokeColor=colors.grey, strokeWidth=0.3))
-        hx = x + i * 5
-        if hx < x + angle_leg and hx > x + angle_t:
-            d.add(Line(hx, y, hx + 3, y + angle_t, strokeColor=colors.grey, strokeWidth=0.3))
+    steps = [i * 5 for i in range(int(angle_leg / 5))]
+    hatch = [(x, y + s, x + angle_t, y + s + 3) for s in steps if s < angle_leg]
+    hatch += [(x + s, y, x + s + 3, y + angle_t) for s in steps if angle_t < s < angle_leg]
+    draw_lines(d, hatch, colors.grey, 0.3)
     
     # Vertical plate (forge side)
     plate_t = 8
@@ -861,23 +1012,21 @@ def draw_corner_detail(width_px=400, height_px=280):
     d.add(Rect(x - 10, y - plate_t - 2, angle_leg + 20, plate_t, fillColor=None, strokeColor=colors.black, strokeWidth=1.5))
     
     # Bolts (4 per corner - 2 each direction)
+    # All bolt parts are unfilled, so each kind is drawn as one batch
     bolt_positions_v = [y + 20, y + 50]
-    for by in bolt_positions_v:
-        # Bolt shaft
-        d.add(Line(x - plate_t - 5, by, x + angle_t/2, by, strokeColor=colors.black, strokeWidth=1.5))
-        # Bolt head (hexagon simplified as circle)
-        d.add(Circle(x - plate_t - 5, by, 4, fillColor=None, strokeColor=colors.black, strokeWidth=1))
-        # Nut
-        d.add(Rect(x + angle_t/2 - 3, by - 3, 6, 6, fillColor=None, strokeColor=colors.black, strokeWidth=0.75))
-    
     bolt_positions_h = [x + 20, x + 50]
-    for bx in bolt_positions_h:
-        # Bolt shaft
-        d.add(Line(bx, y - plate_t - 5, bx, y + angle_t/2, strokeColor=colors.black, strokeWidth=1.5))
-        # Bolt head
-        d.add(Circle(bx, y - plate_t - 5, 4, fillColor=None, strokeColor=colors.black, strokeWidth=1))
-        # Nut
-        d.add(Rect(bx - 3, y + angle_t/2 - 3, 6, 6, fillColor=None, strokeColor=colors.black, strokeWidth=0.75))
+    # Bolt shafts
+    draw_lines(d, [(x - plate_t - 5, by, x + angle_t/2, by) for by in bolt_positions_v] +
+                  [(bx, y - plate_t - 5, bx, y + angle_t/2) for bx in bolt_positions_h],
+               colors.black, 1.5)
+    # Bolt heads (hexagon simplified as circle)
+    draw_circles(d, [(x - plate_t - 5, by) for by in bolt_positions_v] +
+                    [(bx, y - plate_t - 5) for bx in bolt_positions_h], 4,
+                 strokeColor=colors.black, strokeWidth=1)
+    # Nuts
+    for nx, ny in ([(x + angle_t/2, by) for by in bolt_positions_v] +
+                   [(bx, y + angle_t/2) for bx in bolt_positions_h]):
+        d.add(Rect(nx - 3, ny - 3, 6, 6, fillColor=None, strokeColor=colors.black, strokeWidth=0.75))
     
     # Dimension lines
     draw_dimension_line(d, x, y + angle_leg + 5, x + angle_leg, y + angle_leg + 5, '2"', offset=12)
@@ -913,12 +1062,12 @@ def draw_corner_detail(width_px=400, height_px=280):
     d.add(Rect(px + 5, py + 5, 50, 8, fillColor=None, strokeColor=colors.black, strokeWidth=0.75))
     
     # Bolt positions (4 total)
-    for bpos in [(px + 10, py + 20), (px + 10, py + 40), (px + 25, py + 10), (px + 45, py + 10)]:
-        d.add(Circle(bpos[0], bpos[1], 3, fillColor=colors.black, strokeColor=colors.black))
+    draw_circles(d, [(px + 10, py + 20), (px + 10, py + 40), (px + 25, py + 10), (px + 45, py + 10)], 3,
+                 fillColor=colors.black, strokeColor=colors.black)
     
     # Title block
     d.add(Line(10, 15, width_px - 10, 15, strokeColor=colors.black, strokeWidth=0.5))
-    d.add(String(width_px/2 - 70, 5, 'CORNER ASSEMBLY DETAIL', fontSize=9, fillColor=colors.black))
+    d.add(String(width_px/2 - text_width('CORNER ASSEMBLY DETAIL', 9)/2, 5, 'CORNER ASSEMBLY DETAIL', fontSize=9, fillColor=colors.black))
     
     return d
 
@@ -929,13 +1078,14 @@ def draw_corner_detail(width_px=400, height_px=280):
 
 def create_styles():
     """Create custom paragraph styles for PDF."""
+    _ensure_reportlab()
     styles = getSampleStyleSheet()
     
     styles.add(ParagraphStyle(
         'CustomTitle',
         parent=styles['Heading1'],
         fontSize=24,
-        textColor=colors.HexColor('#1a1a1a'),
+        textColor=TITLE_COLOR,
         spaceAfter=30,
         alignment=TA_CENTER
     ))
@@ -944,7 +1094,7 @@ def create_styles():
         'CustomHeading',
         parent=styles['Heading2'],
         fontSize=16,
-        textColor=colors.HexColor('#2c5aa0'),
+        textColor=HEADING_COLOR,
         spaceAfter=12,
         spaceBefore=12
     ))
@@ -953,7 +1103,7 @@ def create_styles():
         'CustomSubHeading',
         parent=styles['Heading3'],
         fontSize=12,
-        textColor=colors.HexColor('#444444'),
+        textColor=SUBHEADING_COLOR,
         spaceAfter=10,
         spaceBefore=10
     ))
@@ -969,9 +1119,41 @@ def create_styles():
     
     return styles
 
+# Shared stylesheet, built once on first use
+_STYLES = None
+
+def get_styles():
+    """Return the shared PDF stylesheet, creating it on first call."""
+    global _STYLES
+    if _STYLES is None:
+        _STYLES = create_styles()
+    return _STYLES
+
+@functools.lru_cache(maxsize=None)
+def get_table_style(body_color, fontsize=9, align=None, valign=None):
+    """
+    Return the shared grey-header grid TableStyle, built once per combination.
+    body_color is a reportlab.lib.colors name, e.g. 'lightblue'.
+    """
+    _ensure_reportlab()
+    commands = [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), fontsize),
+        ('BACKGROUND', (0, 1), (-1, -1), getattr(colors, body_color)),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ]
+    if align:
+        commands.append(('ALIGN', (0, 0), (-1, -1), align))
+    if valign:
+        commands.append(('VALIGN', (0, 0), (-1, -1), valign))
+    return TableStyle(commands)
+
 def build_pdf(specs):
     """Generate complete PDF build guide from specifications."""
-    filename = f"Forge_Build_Guide_{int(specs['internal_volume'])}ci.pdf"
+    _ensure_reportlab()
+    filename = pdf_filename(specs)
     doc = SimpleDocTemplate(
         filename, 
         pagesize=letter,
@@ -981,10 +1163,10 @@ def build_pdf(specs):
         bottomMargin=0.5*inch
     )
     
-    styles = create_styles()
+    styles = get_styles()
     story = []
     
-    debug_log(f"Building PDF: {filename}")
+    debug_log("Building PDF: %s", filename)
     
     # =========================================================================
     # PAGE 1: TITLE PAGE
@@ -1150,15 +1332,7 @@ def build_pdf(specs):
     ]
     
     dim_table = Table(dim_data, colWidths=[2*inch, 2*inch, 2*inch])
-    dim_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    dim_table.setStyle(get_table_style('lightblue', fontsize=10, align='CENTER'))
     story.append(dim_table)
     story.append(Spacer(1, 0.2*inch))
     
@@ -1174,15 +1348,7 @@ def build_pdf(specs):
     ]
     
     sys_table = Table(sys_data, colWidths=[1.8*inch, 2*inch, 2.5*inch])
-    sys_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightyellow),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    sys_table.setStyle(get_table_style('lightyellow', align='LEFT'))
     story.append(sys_table)
     story.append(PageBreak())
     
@@ -1205,14 +1371,7 @@ def build_pdf(specs):
     ]
     
     steel_table = Table(steel_bom, colWidths=[2.5*inch, 1.5*inch, 2.5*inch])
-    steel_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    steel_table.setStyle(get_table_style('lightblue'))
     story.append(steel_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -1228,14 +1387,7 @@ def build_pdf(specs):
     ]
     
     refrac_table = Table(refrac_bom, colWidths=[2.5*inch, 1.5*inch, 2.5*inch])
-    refrac_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightyellow),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    refrac_table.setStyle(get_table_style('lightyellow'))
     story.append(refrac_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -1255,14 +1407,7 @@ def build_pdf(specs):
     ]
     
     hw_table = Table(hw_bom, colWidths=[2.5*inch, 1*inch, 3*inch])
-    hw_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    hw_table.setStyle(get_table_style('lightgreen'))
     story.append(hw_table)
     story.append(Spacer(1, 0.15*inch))
     story.append(Paragraph(f"<b>Estimated Total Cost:</b> ${specs['estimated_cost']} (excluding steel you may already have)", styles['BodyText']))
@@ -1275,37 +1420,24 @@ def build_pdf(specs):
     story.append(Spacer(1, 0.1*inch))
     
     story.append(Paragraph("<b>1/4\" Steel Plate Cuts:</b>", styles['CustomSubHeading']))
-    plate_data = [["Panel", "Qty", "Width", "Height", "Notes"]]
-    for cut in specs['steel_cuts']['plates']:
-        note = cut.get('note', '—')
-        plate_data.append([cut['name'], str(cut['qty']), f'{cut["w"]:.1f}"', f'{cut["h"]:.1f}"', note])
+    plate_data = [["Panel", "Qty", "Width", "Height", "Notes"]] + [
+        [cut.name, str(cut.qty), f'{cut.w:.1f}"', f'{cut.h:.1f}"', cut.note or '—']
+        for cut in specs['steel_cuts']['plates']
+    ]
     
     plate_table = Table(plate_data, colWidths=[1.5*inch, 0.5*inch, 1*inch, 1*inch, 2.5*inch])
-    plate_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightcyan),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    plate_table.setStyle(get_table_style('lightcyan'))
     story.append(plate_table)
     story.append(Spacer(1, 0.15*inch))
     
     story.append(Paragraph("<b>Angle Iron Cuts (2\" × 2\" × 1/8\"):</b>", styles['CustomSubHeading']))
-    angle_data = [["Component", "Qty", "Length"]]
-    for cut in specs['steel_cuts']['angle_iron']:
-        angle_data.append([cut['name'], str(cut['qty']), f'{cut["length"]:.1f}"'])
+    angle_data = [["Component", "Qty", "Length"]] + [
+        [cut.name, str(cut.qty), f'{cut.length:.1f}"']
+        for cut in specs['steel_cuts']['angle_iron']
+    ]
     
     angle_table = Table(angle_data, colWidths=[2.5*inch, 1*inch, 1.5*inch])
-    angle_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightyellow),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    angle_table.setStyle(get_table_style('lightyellow'))
     story.append(angle_table)
     story.append(Spacer(1, 0.2*inch))
     
@@ -1377,14 +1509,7 @@ def build_pdf(specs):
     ]
     
     burner_table = Table(burner_specs, colWidths=[2*inch, 4.5*inch])
-    burner_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    burner_table.setStyle(get_table_style('lightblue'))
     story.append(burner_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -1431,14 +1556,7 @@ def build_pdf(specs):
     ]
     
     door_table = Table(door_data, colWidths=[2*inch, 2.2*inch, 2.2*inch])
-    door_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    door_table.setStyle(get_table_style('lightgreen'))
     story.append(door_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -1475,14 +1593,7 @@ def build_pdf(specs):
     ]
     
     air_table = Table(air_data, colWidths=[2*inch, 4.5*inch])
-    air_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightcyan),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    air_table.setStyle(get_table_style('lightcyan'))
     story.append(air_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -1500,14 +1611,7 @@ def build_pdf(specs):
     ]
     
     gas_table = Table(gas_data, colWidths=[2*inch, 4.5*inch])
-    gas_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightyellow),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    gas_table.setStyle(get_table_style('lightyellow'))
     story.append(gas_table)
     story.append(Spacer(1, 0.1*inch))
     
@@ -1555,14 +1659,7 @@ def build_pdf(specs):
     ]
     
     cure_table = Table(cure_data, colWidths=[0.8*inch, 1.5*inch, 1.5*inch, 2.5*inch])
-    cure_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightyellow),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    cure_table.setStyle(get_table_style('lightyellow'))
     story.append(cure_table)
     story.append(Spacer(1, 0.1*inch))
     story.append(Paragraph(
@@ -1628,14 +1725,7 @@ def build_pdf(specs):
     ]
     
     flame_table = Table(flame_data, colWidths=[1.5*inch, 2.5*inch, 2.5*inch])
-    flame_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightyellow),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    flame_table.setStyle(get_table_style('lightyellow', fontsize=10))
     story.append(flame_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -1668,15 +1758,7 @@ def build_pdf(specs):
     ]
     
     trouble_table = Table(trouble_data, colWidths=[1.5*inch, 2.2*inch, 2.8*inch])
-    trouble_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
+    trouble_table.setStyle(get_table_style('lightgrey', fontsize=8, valign='TOP'))
     story.append(trouble_table)
     story.append(PageBreak())
     
@@ -1725,14 +1807,7 @@ def build_pdf(specs):
     ]
     
     perf_table = Table(perf_data, colWidths=[2*inch, 4.5*inch])
-    perf_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightcyan),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    perf_table.setStyle(get_table_style('lightcyan'))
     story.append(perf_table)
     
     # Build the PDF
@@ -1741,11 +1816,116 @@ def build_pdf(specs):
     
     return filename
 
+def _build_pdf_worker(job):
+    """
+    Pool worker for build_pdfs(): job is (specs, shape_checking, debug_mode).
+    The parent's reportlab and debug settings travel with each job, so
+    spawn-start workers don't fall back to shape checking.
+    """
+    global DEBUG_MODE
+    specs, shape_checking, DEBUG_MODE = job
+    from reportlab import rl_config
+    rl_config.shapeChecking = shape_checking
+    return build_pdf(specs)
+
+def build_pdfs(specs_list, jobs=1):
+    """
+    Build a PDF for each specs dict, fanning out over `jobs` worker processes.
+    Designs that map to the same filename are built once (last one wins, as
+    in a serial run) so two workers never write the same file.
+    Returns the filenames in build order.
+    """
+    by_file = {}
+    for specs in specs_list:
+        by_file.pop(pdf_filename(specs), None)
+        by_file[pdf_filename(specs)] = specs
+    unique = list(by_file.values())
+    
+    if jobs <= 1 or len(unique) < 2:
+        return [build_pdf(specs) for specs in unique]
+    
+    from concurrent.futures import ProcessPoolExecutor
+    from reportlab import rl_config
+    work = [(specs, rl_config.shapeChecking, DEBUG_MODE) for specs in unique]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(unique))) as pool:
+        return list(pool.map(_build_pdf_worker, work))
+
 
 # =============================================================================
 # MAIN ENTRY POINT
 # =============================================================================
 
+def load_batch_inputs(path):
+    """
+    Read a JSONL file into a list of (line number, user-input dict) pairs.
+    Missing fields take the interactive defaults; blank lines are skipped.
+    The whole file is checked before any design is built, so a bad line
+    raises ValueError naming its line instead of stopping a half-written run.
+    """
+    defaults = (('width', 6, float), ('height', 6, float), ('length', 14, float),
+                ('insulation', 2, float), ('door_config', 1, int))
+    designs = []
+    with open(path) as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"Line {line_no}: {e}") from None
+            if not isinstance(row, dict):
+                raise ValueError(f"Line {line_no}: expected a JSON object")
+            user_input = {}
+            for key, default, convert in defaults:
+                value = row.get(key, default)
+                try:
+                    user_input[key] = convert(value)
+                except (TypeError, ValueError):
+                    raise ValueError(f"Line {line_no}: {key} must be a number, got {value!r}") from None
+            designs.append((line_no, user_input))
+    
+    for line_no, user_input in designs:
+        for w in validate_inputs(user_input['width'], user_input['height'],
+                                 user_input['length'], user_input['insulation']):
+            print(f"[!] Line {line_no}: {w}")
+    return designs
+
+def output_design(specs, export_json=False, make_pdf=True):
+    """Print the design summary, then write the JSON export and PDF as requested."""
+    # Display summary (one write, so consoles that flush per call only flush once)
+    print("\n".join([
+        "\n" + "=" * 60,
+        "   FORGE DESIGN SUMMARY",
+        "=" * 60,
+        f"   Chamber Volume:    {int(specs['internal_volume'])} cubic inches",
+        f"   External Size:     {specs['external_w']:.1f}\" × {specs['external_h']:.1f}\" × {specs['external_l']:.1f}\"",
+        f"   Ribbon Burner:     {specs['burner_holes']} holes, {specs['burner_length']}\" long",
+        f"   Blower Required:   {specs['cfm_recommended']} CFM @ {specs['static_pressure']}\" WC",
+        f"   Refractory:        {specs['refractory_bags']} bags Kast-O-Lite 30",
+        f"   Ceramic Blanket:   {specs['blanket_sqft']} sq ft",
+        f"   Estimated Cost:    ${specs['estimated_cost']}",
+        "=" * 60,
+    ]))
+    
+    # Export JSON if requested
+    if export_json:
+        json_file = json_filename(specs)
+        with open(json_file, 'w') as f:
+            json.dump(specs_for_json(specs), f, indent=2, default=str)
+        print(f"\n[*] Specs exported to: {json_file}")
+    
+    if not make_pdf:
+        debug_log("PDF generation skipped")
+        return
+    
+    # Generate PDF
+    print("\n[*] Generating PDF build guide...")
+    pdf_file = build_pdf(specs)
+    
+    print(f"\n[SUCCESS] Build guide generated: {pdf_file}")
+    print("          Open the PDF for complete instructions, safety info, and diagrams.")
+
 def main():
     """Main application entry point."""
     global DEBUG_MODE
@@ -1756,6 +1936,11 @@ def main():
     )
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
     parser.add_argument('--json', action='store_true', help='Export specs to JSON file')
+    parser.add_argument('--no-pdf', action='store_true', help='Skip PDF generation (use with --json)')
+    parser.add_argument('--batch', metavar='FILE',
+                        help='Generate one design per line of a JSONL file instead of prompting')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='Worker processes for --batch PDF generation (default: 1)')
     args = parser.parse_args()
     
     DEBUG_MODE = args.debug
@@ -1765,41 +1950,51 @@ def main():
         print(f"[DEBUG] Python version: {sys.version}")
         print()
     
+    # Per-attribute shape validation is only worth its cost while debugging.
+    # Set before reportlab.graphics.shapes is first imported so Shape
+    # doesn't install its checking __setattr__ at all.
+    if not DEBUG_MODE and not args.no_pdf:
+        from reportlab import rl_config
+        rl_config.shapeChecking = 0
+    
     try:
+        if args.batch:
+            designs = load_batch_inputs(args.batch)
+            # One timestamp for the whole run
+            generated_date = datetime.now().strftime("%Y-%m-%d %H:%M")
+            claimed = {}
+            specs_list = []
+            for line_no, user_input in designs:
+                debug_log("Batch input received: %s", user_input)
+                specs = calculate_forge_specs(user_input, generated_date)
+                # Outputs are named by volume; say so when a line overwrites another's
+                outputs = [json_filename(specs)] if args.json else []
+                if not args.no_pdf:
+                    outputs.append(pdf_filename(specs))
+                key = pdf_filename(specs)
+                if outputs and key in claimed:
+                    print(f"[!] Line {line_no}: same volume as line {claimed[key]} - "
+                          f"replaces {', '.join(outputs)}")
+                claimed[key] = line_no
+                output_design(specs, args.json, make_pdf=False)
+                specs_list.append(specs)
+            
+            if not args.no_pdf and specs_list:
+                print(f"\n[*] Generating PDF build guides ({args.jobs} job(s))...")
+                for pdf_file in build_pdfs(specs_list, args.jobs):
+                    print(f"[SUCCESS] Build guide generated: {pdf_file}")
+            print(f"\n[*] Batch complete: {len(specs_list)} designs")
+            return
+        
         # Get user input
         user_input = get_user_input()
-        debug_log(f"User input received: {user_input}")
+        debug_log("User input received: %s", user_input)
         
         # Calculate specifications
         print("\n[*] Calculating forge specifications...")
         specs = calculate_forge_specs(user_input)
         
-        # Display summary
-        print("\n" + "=" * 60)
-        print("   FORGE DESIGN SUMMARY")
-        print("=" * 60)
-        print(f"   Chamber Volume:    {int(specs['internal_volume'])} cubic inches")
-        print(f"   External Size:     {specs['external_w']:.1f}\" × {specs['external_h']:.1f}\" × {specs['external_l']:.1f}\"")
-        print(f"   Ribbon Burner:     {specs['burner_holes']} holes, {specs['burner_length']}\" long")
-        print(f"   Blower Required:   {specs['cfm_recommended']} CFM @ {specs['static_pressure']}\" WC")
-        print(f"   Refractory:        {specs['refractory_bags']} bags Kast-O-Lite 30")
-        print(f"   Ceramic Blanket:   {specs['blanket_sqft']} sq ft")
-        print(f"   Estimated Cost:    ${specs['estimated_cost']}")
-        print("=" * 60)
-        
-        # Export JSON if requested
-        if args.json:
-            json_file = f"forge_specs_{int(specs['internal_volume'])}ci.json"
-            with open(json_file, 'w') as f:
-                json.dump(specs, f, indent=2, default=str)
-            print(f"\n[*] Specs exported to: {json_file}")
-        
-        # Generate PDF
-        print("\n[*] Generating PDF build guide...")
-        pdf_file = build_pdf(specs)
-        
-        print(f"\n[SUCCESS] Build guide generated: {pdf_file}")
-        print("          Open the PDF for complete instructions, safety info, and diagrams.")
+        output_design(specs, args.json, not args.no_pdf)
         
     except KeyboardInterrupt:
         print("\n\nOperation cancelled.")
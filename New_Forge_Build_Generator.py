@@ -6,6 +6,9 @@ Requires: reportlab (pip install reportlab)
 """
 
 import sys
+from reportlab import rl_config
+# Skip per-attribute shape validation; must be set before reportlab.graphics.shapes is imported
+rl_config.shapeChecking = 0
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
@@ -30,7 +33,7 @@ def get_forge_specs():
         
         # Burner & Blower Math
         total_holes = max(12, round(vol / 18))
-        h_per_row = round(total_holes / 3)
+        h_per_row = (total_holes + 1) // 3  # == round(total_holes / 3); thirds never land on .5
         b_len = round((h_per_row * 0.75) + 1.5, 1)
         cfm = round((vol / 18) * 1.2)
         static_p = "1.5" if vol < 500 else "3.0"
@@ -62,27 +65,32 @@ def draw_exploded_view(specs, width_px=500, height_px=350):
     w, h, l = specs['ext_w'], specs['ext_h'], specs['ext_l']
     scale, x_off, y_off, gap = 6.0, 220, 100, 50
 
+    # Project the corner frame once at z=0; each plane is that frame shifted by z along the depth axis
+    corners = [(0,0), (w,0), (w,h), (0,h)]
+    base = [iso_project(ix, iy, 0, x_off, y_off, scale) for ix, iy in corners]
+    dzx, dzy = -0.866 * scale, 0.5 * scale
+    def at_depth(z):
+        return [(bx + z * dzx, by + z * dzy) for bx, by in base]
+
     # Back Plate
     bz = l + gap
-    bp = [iso_project(ix, iy, bz, x_off, y_off, scale) for ix, iy in [(0,0), (w,0), (w,h), (0,h)]]
-    d.add(Polygon([bp[0][0],bp[0][1], bp[1][0],bp[1][1], bp[2][0],bp[2][1], bp[3][0],bp[3][1]], fillColor=colors.lightgrey))
+    bp = at_depth(bz)
+    d.add(Polygon([c for pt in bp for c in pt], fillColor=colors.lightgrey))
     
     # Body
-    p_front = [iso_project(ix, iy, 0, x_off, y_off, scale) for ix, iy in [(0,0), (w,0), (w,h), (0,h)]]
-    p_back = [iso_project(ix, iy, l, x_off, y_off, scale) for ix, iy in [(0,0), (w,0), (w,h), (0,h)]]
-    d.add(Polygon([p_front[0][0],p_front[0][1], p_front[1][0],p_front[1][1], p_front[2][0],p_front[2][1], p_front[3][0],p_front[3][1]], fillColor=colors.grey))
+    p_front = base
+    p_back = at_depth(l)
+    d.add(Polygon([c for pt in p_front for c in pt], fillColor=colors.grey))
     for s, e in zip(p_front, p_back): d.add(Line(s[0],s[1],e[0],e[1]))
 
     # Front Plate
     fz = -gap
-    fp = [iso_project(ix, iy, fz, x_off, y_off, scale) for ix, iy in [(0,0), (w,0), (w,h), (0,h)]]
-    d.add(Polygon([fp[0][0],fp[0][1], fp[1][0],fp[1][1], fp[2][0],fp[2][1], fp[3][0],fp[3][1]], fillColor=colors.lightgrey))
+    fp = at_depth(fz)
+    d.add(Polygon([c for pt in fp for c in pt], fillColor=colors.lightgrey))
 
     # Threaded Rods (Sandwich Hardware)
-    for ix, iy in [(0,0), (w,0), (w,h), (0,h)]:
-        start = iso_project(ix, iy, fz-10, x_off, y_off, scale)
-        end = iso_project(ix, iy, bz+10, x_off, y_off, scale)
-        d.add(Line(start[0],start[1], end[0],end[1], strokeColor=colors.black, strokeDashArray=[2,2]))
+    for start, end in zip(at_depth(fz-10), at_depth(bz+10)):
+        d.add(Line(start[0],start[1], end[0],end[1], strokeColor=colors.black, strokeDashArray=(2,2)))
         d.add(Circle(start[0],start[1], 3, fillColor=colors.darkgrey)) # Hardware Nut
     
     return d
@@ -105,17 +113,20 @@ def draw_manifold_detail(width_px=500, height_px=200):
 
 # --- PDF BUILDER ---
 
+SPEC_TABLE_STYLE = TableStyle([('BACKGROUND',(0,0),(-1,0),colors.black), ('TEXTCOLOR',(0,0),(-1,0),colors.white), ('GRID',(0,0),(-1,-1),0.5,colors.grey)])
+
 def create_full_guide(s):
     doc = SimpleDocTemplate(f"Forge_Master_Guide_{int(s['vol'])}ci.pdf", pagesize=letter)
     styles = getSampleStyleSheet()
+    normal = styles['Normal']
     elements = []
 
     # PAGE 1: Overview & Specs
     elements.append(Paragraph(f"Forge Build Guide: {int(s['vol'])}in³ Chamber", styles['Title']))
-    elements.append(Paragraph(f"This document outlines a modular, non-welded forced-air forge designed for high-efficiency ribbon burner operation. <b>Estimated Cost: ${s['cost']}</b>", styles['Normal']))
+    elements.append(Paragraph(f"This document outlines a modular, non-welded forced-air forge designed for high-efficiency ribbon burner operation. <b>Estimated Cost: ${s['cost']}</b>", normal))
     elements.append(Spacer(1, 0.5*inch))
     elements.append(draw_exploded_view(s))
-    elements.append(Paragraph("<b>Exploded Assembly:</b> Threaded rods compress the exterior plates against the insulated chassis, allowing for complete disassembly and maintenance.", styles['Normal']))
+    elements.append(Paragraph("<b>Exploded Assembly:</b> Threaded rods compress the exterior plates against the insulated chassis, allowing for complete disassembly and maintenance.", normal))
     
     # PAGE 2: System Specifications
     elements.append(PageBreak())
@@ -128,7 +139,7 @@ def create_full_guide(s):
         ["Manifold", "Black Iron Pipe", "2\" Main Supply Pipe"]
     ]
     t = Table(table_data, colWidths=[1.5*inch, 2*inch, 2.5*inch])
-    t.setStyle(TableStyle([('BACKGROUND',(0,0),(-1,0),colors.black), ('TEXTCOLOR',(0,0),(-1,0),colors.white), ('GRID',(0,0),(-1,-1),0.5,colors.grey)]))
+    t.setStyle(SPEC_TABLE_STYLE)
     elements.append(t)
     elements.append(Spacer(1, 0.4*inch))
     elements.append(draw_manifold_detail())
@@ -137,9 +148,9 @@ def create_full_guide(s):
     elements.append(PageBreak())
     elements.append(Paragraph("Assembly & Flame Tuning", styles['Heading2']))
     for step in ["1. Build Chassis", "2. Cast Burner Block", "3. Line with 1/2\" Refractory", "4. Install Manifold"]:
-        elements.append(Paragraph(f"<b>{step}</b>", styles['Normal']))
+        elements.append(Paragraph(f"<b>{step}</b>", normal))
     elements.append(Spacer(1, 0.3*inch))
-    elements.append(Paragraph("<b>Tuning:</b> Adjust for a 'Neutral' flame (short blue cones). If scale builds up on steel, increase gas (Reducing). If forge is loud and hissing with no flame, decrease air (Oxidizing).", styles['Normal']))
+    elements.append(Paragraph("<b>Tuning:</b> Adjust for a 'Neutral' flame (short blue cones). If scale builds up on steel, increase gas (Reducing). If forge is loud and hissing with no flame, decrease air (Oxidizing).", normal))
 
     doc.build(elements)
     print(f"\n[Success] Professional guide generated: Forge_Master_Guide_{int(s['vol'])}ci.pdf")
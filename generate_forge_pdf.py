@@ -3,6 +3,11 @@
 Generate an illustrated PDF for the Ribbon Burner Forge Design
 """
 
+import functools
+
+from reportlab import rl_config
+# Skip per-attribute shape validation; must be set before reportlab.graphics.shapes is imported
+rl_config.shapeChecking = 0
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib import colors
@@ -11,9 +16,24 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from reportlab.pdfgen import canvas
 from reportlab.graphics.shapes import Drawing, Rect, Line, Circle, String, Polygon
-from reportlab.graphics import renderPDF
-from io import BytesIO
 
+# Paragraph style text colors
+TITLE_COLOR = colors.HexColor('#1a1a1a')
+HEADING_COLOR = colors.HexColor('#2c5aa0')
+SUBHEADING_COLOR = colors.HexColor('#444444')
+def cached_drawing(create):
+    """
+    Memoize a create_*_drawing function on its size arguments. The diagrams
+    don't depend on anything else, so repeat calls reuse the built shapes;
+    each call still gets its own Drawing container so no two stories share one.
+    """
+    cached = functools.lru_cache(maxsize=4)(create)
+    @functools.wraps(create)
+    def wrapper(*args, **kwargs):
+        return cached(*args, **kwargs).copy()
+    return wrapper
+
+@cached_drawing
 def create_3d_box_drawing(width_px=400, height_px=300):
     """Create isometric view of forge body"""
     d = Drawing(width_px, height_px)
@@ -82,6 +102,7 @@ def create_3d_box_drawing(width_px=400, height_px=300):
     
     return d
 
+@cached_drawing
 def create_burner_drawing(width_px=400, height_px=300):
     """Create ribbon burner detail drawing - side view showing bottom holes"""
     d = Drawing(width_px, height_px)
@@ -126,7 +147,7 @@ def create_burner_drawing(width_px=400, height_px=300):
     # Internal baffle indication (dashed line)
     baffle_x = x + 60
     d.add(Line(baffle_x, y, baffle_x, y + h, strokeColor=colors.grey, 
-               strokeWidth=1, strokeDashArray=[3, 3]))
+               strokeWidth=1, strokeDashArray=(3, 3)))
     d.add(String(baffle_x - 25, y + h + 12, 'Baffle', fontSize=8, fillColor=colors.grey))
     
     # Dimensions
@@ -141,6 +162,7 @@ def create_burner_drawing(width_px=400, height_px=300):
     
     return d
 
+@cached_drawing
 def create_door_drawing(width_px=400, height_px=300):
     """Create sliding door system on round rod"""
     d = Drawing(width_px, height_px)
@@ -226,6 +248,7 @@ def create_door_drawing(width_px=400, height_px=300):
     
     return d
 
+@cached_drawing
 def create_angle_iron_frame_drawing(width_px=400, height_px=300):
     """Create corner detail showing angle iron and bolted assembly"""
     d = Drawing(width_px, height_px)
@@ -311,6 +334,7 @@ def create_angle_iron_frame_drawing(width_px=400, height_px=300):
     
     return d
 
+@cached_drawing
 def create_assembly_overview(width_px=500, height_px=400):
     """Create complete assembly overview"""
     d = Drawing(width_px, height_px)
@@ -380,27 +404,14 @@ def create_assembly_overview(width_px=500, height_px=400):
     
     return d
 
-def save_drawing_as_image(drawing, filename):
-    """Helper to save drawing for inclusion in PDF"""
-    renderPDF.drawToFile(drawing, filename)
-
-# Create the PDF
-def generate_pdf():
-    filename = "/home/gary/ribbon_burner_forge_design.pdf"
-    doc = SimpleDocTemplate(filename, pagesize=letter,
-                           rightMargin=0.5*inch, leftMargin=0.5*inch,
-                           topMargin=0.5*inch, bottomMargin=0.5*inch)
-    
-    # Container for content
-    story = []
-    
-    # Styles
+def create_styles():
+    """Build the title, heading, subheading and body paragraph styles."""
     styles = getSampleStyleSheet()
     title_style = ParagraphStyle(
         'CustomTitle',
         parent=styles['Heading1'],
         fontSize=24,
-        textColor=colors.HexColor('#1a1a1a'),
+        textColor=TITLE_COLOR,
         spaceAfter=30,
         alignment=TA_CENTER
     )
@@ -409,7 +420,7 @@ def generate_pdf():
         'CustomHeading',
         parent=styles['Heading2'],
         fontSize=16,
-        textColor=colors.HexColor('#2c5aa0'),
+        textColor=HEADING_COLOR,
         spaceAfter=12,
         spaceBefore=12
     )
@@ -418,13 +429,55 @@ def generate_pdf():
         'CustomSubHeading',
         parent=styles['Heading3'],
         fontSize=12,
-        textColor=colors.HexColor('#444444'),
+        textColor=SUBHEADING_COLOR,
         spaceAfter=10,
         spaceBefore=10
     )
     
     body_style = styles['BodyText']
     
+    return title_style, heading_style, subheading_style, body_style
+
+# Shared styles, built once on first use
+_STYLES = None
+
+def get_styles():
+    """Return the shared paragraph styles, creating them on first call."""
+    global _STYLES
+    if _STYLES is None:
+        _STYLES = create_styles()
+    return _STYLES
+
+@functools.lru_cache(maxsize=None)
+def get_table_style(body_color, fontsize=9, align='LEFT'):
+    """
+    Return the shared grey-header grid TableStyle, built once per combination.
+    body_color is a reportlab.lib.colors name, e.g. 'lightblue'.
+    """
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), align),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), fontsize),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), getattr(colors, body_color)),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
+# Create the PDF
+def generate_pdf():
+    filename = "/home/gary/ribbon_burner_forge_design.pdf"
+    doc = SimpleDocTemplate(filename, pagesize=letter,
+                           rightMargin=0.5*inch, leftMargin=0.5*inch,
+                           topMargin=0.5*inch, bottomMargin=0.5*inch)
+    
+    # Container for content
+    story = []
+    
+    # Styles
+    title_style, heading_style, subheading_style, body_style = get_styles()
+    
     # Title Page
     story.append(Spacer(1, 2*inch))
     story.append(Paragraph("Forced Air Ribbon Burner Forge", title_style))
@@ -474,16 +527,7 @@ def generate_pdf():
     ]
     
     materials_table = Table(materials_data, colWidths=[0.8*inch, 2.5*inch, 3*inch])
-    materials_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    materials_table.setStyle(get_table_style('beige', fontsize=10))
     story.append(materials_table)
     story.append(Spacer(1, 0.2*inch))
     
@@ -523,16 +567,7 @@ def generate_pdf():
     ]
     
     dim_table = Table(dimensions_data, colWidths=[1.5*inch, 1.3*inch, 2*inch, 1.8*inch])
-    dim_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    dim_table.setStyle(get_table_style('lightblue', align='CENTER'))
     story.append(dim_table)
     story.append(PageBreak())
     
@@ -561,17 +596,7 @@ def generate_pdf():
     ]
     
     burner_table = Table(burner_specs, colWidths=[2*inch, 4*inch])
-    burner_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    burner_table.setStyle(get_table_style('lightblue'))
     story.append(burner_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -607,16 +632,7 @@ def generate_pdf():
     ]
     
     door_table = Table(door_specs, colWidths=[2*inch, 2*inch, 2*inch])
-    door_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    door_table.setStyle(get_table_style('lightgreen'))
     story.append(door_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -651,16 +667,7 @@ def generate_pdf():
     ]
     
     frame_table = Table(frame_parts, colWidths=[2*inch, 1*inch, 1*inch, 2.5*inch])
-    frame_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightyellow),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    frame_table.setStyle(get_table_style('lightyellow'))
     story.append(frame_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -696,16 +703,7 @@ def generate_pdf():
     ]
     
     air_table = Table(air_components, colWidths=[2*inch, 4.5*inch])
-    air_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightcyan),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    air_table.setStyle(get_table_style('lightcyan'))
     story.append(air_table)
     story.append(Spacer(1, 0.2*inch))
     
@@ -723,16 +721,7 @@ def generate_pdf():
     ]
     
     gas_table = Table(gas_components, colWidths=[2*inch, 4.5*inch])
-    gas_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightyellow),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    gas_table.setStyle(get_table_style('lightyellow'))
     story.append(gas_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -805,16 +794,7 @@ def generate_pdf():
     ]
     
     steel_table = Table(steel_bom, colWidths=[2.5*inch, 1.5*inch, 2.5*inch])
-    steel_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    steel_table.setStyle(get_table_style('lightblue'))
     story.append(steel_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -831,16 +811,7 @@ def generate_pdf():
     ]
     
     refrac_table = Table(refrac_bom, colWidths=[2.5*inch, 1.5*inch, 2.5*inch])
-    refrac_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightyellow),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    refrac_table.setStyle(get_table_style('lightyellow'))
     story.append(refrac_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -861,16 +832,7 @@ def generate_pdf():
     ]
     
     hardware_table = Table(hardware_bom, colWidths=[2.5*inch, 1*inch, 3*inch])
-    hardware_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    hardware_table.setStyle(get_table_style('lightgreen'))
     story.append(hardware_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -902,16 +864,7 @@ def generate_pdf():
     ]
     
     flame_table = Table(flame_guide, colWidths=[2.5*inch, 2*inch, 2*inch])
-    flame_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightyellow),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    flame_table.setStyle(get_table_style('lightyellow'))
     story.append(flame_table)
     story.append(Spacer(1, 0.15*inch))
     
@@ -960,16 +913,7 @@ def generate_pdf():
     ]
     
     perf_table = Table(perf_data, colWidths=[2.5*inch, 4*inch])
-    perf_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightcyan),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    perf_table.setStyle(get_table_style('lightcyan'))
     story.append(perf_table)
     story.append(PageBreak())
     
@@ -1018,16 +962,7 @@ def generate_pdf():
     ]
     
     trouble_table = Table(troubleshoot, colWidths=[2.5*inch, 4*inch])
-    trouble_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    trouble_table.setStyle(get_table_style('lightgrey', fontsize=8))
     story.append(trouble_table)
     story.append(Spacer(1, 0.3*inch))
     
@@ -0,0 +1,125 @@
+"""Tests for ForgeDesigner's --batch mode."""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ForgeDesigner
+
+try:
+    import reportlab  # noqa: F401
+    HAVE_REPORTLAB = True
+except ImportError:
+    HAVE_REPORTLAB = False
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def write_batch(self, *lines):
+        with open('designs.jsonl', 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        return 'designs.jsonl'
+
+    def run_main(self, *args):
+        out = io.StringIO()
+        with mock.patch.object(sys, 'argv', ['ForgeDesigner.py'] + list(args)), \
+                contextlib.redirect_stdout(out):
+            try:
+                ForgeDesigner.main()
+                code = 0
+            except SystemExit as e:
+                code = e.code
+        return code, out.getvalue()
+
+    def test_missing_fields_use_defaults_and_blank_lines_are_skipped(self):
+        path = self.write_batch('{"width": 7}', '', '{"door_config": 2}')
+        with contextlib.redirect_stdout(io.StringIO()):
+            designs = ForgeDesigner.load_batch_inputs(path)
+
+        self.assertEqual([line_no for line_no, _ in designs], [1, 3])
+        self.assertEqual(designs[0][1], {'width': 7.0, 'height': 6.0, 'length': 14.0,
+                                         'insulation': 2.0, 'door_config': 1})
+        self.assertEqual(designs[1][1]['door_config'], 2)
+
+    def test_range_warnings_name_their_line(self):
+        path = self.write_batch('{}', '{"width": 20}')
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            ForgeDesigner.load_batch_inputs(path)
+
+        self.assertIn('[!] Line 2: Width 20.0" outside typical range', out.getvalue())
+
+    def test_bad_line_stops_the_run_before_anything_is_written(self):
+        for bad in ('{"width": null}', '[]', '{"width": "wide"}', '{not json'):
+            with self.subTest(line=bad):
+                self.write_batch('{"width": 7}', bad)
+                code, out = self.run_main('--batch', 'designs.jsonl', '--json', '--no-pdf')
+
+                self.assertEqual(code, 1)
+                self.assertIn('[ERROR] Line 2:', out)
+                self.assertEqual(os.listdir('.'), ['designs.jsonl'])
+
+    def test_same_volume_json_warns_and_last_line_wins(self):
+        self.write_batch('{"width": 6, "height": 8}', '{"width": 8, "height": 6, "door_config": 2}')
+        code, out = self.run_main('--batch', 'designs.jsonl', '--json', '--no-pdf')
+
+        self.assertEqual(code, 0)
+        self.assertIn('[!] Line 2: same volume as line 1 - replaces forge_specs_672ci.json', out)
+        with open('forge_specs_672ci.json') as f:
+            specs = json.load(f)
+        self.assertEqual(specs['internal_w'], 8)
+        self.assertEqual(specs['door_config'], 2)
+
+    @unittest.skipUnless(HAVE_REPORTLAB, 'reportlab is not installed')
+    def test_same_volume_pdf_warns(self):
+        self.write_batch('{"width": 6, "height": 8}', '{"width": 8, "height": 6}')
+        code, out = self.run_main('--batch', 'designs.jsonl')
+
+        self.assertEqual(code, 0)
+        self.assertIn('replaces Forge_Build_Guide_672ci.pdf', out)
+        self.assertNotIn('.json', out)
+
+    def test_no_warning_when_nothing_is_written(self):
+        self.write_batch('{"width": 6, "height": 8}', '{"width": 8, "height": 6}')
+        code, out = self.run_main('--batch', 'designs.jsonl', '--no-pdf')
+
+        self.assertEqual(code, 0)
+        self.assertNotIn('same volume', out)
+
+    def test_build_pdfs_builds_each_filename_once_last_wins(self):
+        specs = [ForgeDesigner.calculate_forge_specs(
+                     {'width': w, 'height': h, 'length': 14, 'insulation': 2, 'door_config': 1})
+                 for w, h in ((6, 8), (6, 6), (8, 6))]
+        with mock.patch.object(ForgeDesigner, 'build_pdf', side_effect=ForgeDesigner.pdf_filename) as build:
+            files = ForgeDesigner.build_pdfs(specs)
+
+        self.assertEqual(files, ['Forge_Build_Guide_504ci.pdf', 'Forge_Build_Guide_672ci.pdf'])
+        self.assertIs(build.call_args_list[-1][0][0], specs[2])
+
+    @unittest.skipUnless(HAVE_REPORTLAB, 'reportlab is not installed')
+    def test_jobs_build_every_pdf(self):
+        self.write_batch('{}', '{"width": 7}')
+        code, out = self.run_main('--batch', 'designs.jsonl', '--jobs', '2')
+
+        self.assertEqual(code, 0)
+        self.assertEqual(sorted(os.listdir('.')), ['Forge_Build_Guide_504ci.pdf',
+                                                   'Forge_Build_Guide_588ci.pdf', 'designs.jsonl'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Tests for ForgeDesigner's memoized spec calculations."""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ForgeDesigner
+
+
+def design(width=6, height=6, length=14, insulation=2, door_config=1):
+    return {'width': width, 'height': height, 'length': length,
+            'insulation': insulation, 'door_config': door_config}
+
+
+class CalculateForgeSpecsTest(unittest.TestCase):
+    def tearDown(self):
+        ForgeDesigner.DEBUG_MODE = False
+
+    def test_int_and_float_inputs_are_cached_separately(self):
+        ints = ForgeDesigner.calculate_forge_specs(design())
+        floats = ForgeDesigner.calculate_forge_specs(design(6.0, 6.0, 14.0, 2.0))
+
+        self.assertIs(type(ints['internal_w']), int)
+        self.assertIs(type(floats['internal_w']), float)
+        self.assertIs(type(floats['internal_volume']), float)
+
+    def test_callers_do_not_share_the_steel_cut_list(self):
+        first = ForgeDesigner.calculate_forge_specs(design(7, 8, 14))
+        first['steel_cuts']['plates'] = ()
+        del first['steel_cuts']['angle_iron']
+
+        second = ForgeDesigner.calculate_forge_specs(design(7, 8, 14))
+        self.assertEqual(len(second['steel_cuts']['plates']), 5)
+        self.assertEqual(second['steel_cuts']['angle_iron'][0].qty, 4)
+
+    def test_debug_lines_are_logged_on_a_cache_hit(self):
+        ForgeDesigner.DEBUG_MODE = True
+        logs = []
+        for _ in range(2):
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                ForgeDesigner.calculate_forge_specs(design(5, 5, 12))
+            logs.append(out.getvalue())
+
+        self.assertIn("Internal volume: 300 ci", logs[0])
+        self.assertEqual(logs[0], logs[1])
+
+
+if __name__ == '__main__':
+    unittest.main()